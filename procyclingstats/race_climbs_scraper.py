@@ -1,4 +1,4 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Union
 
 from .errors import ExpectedParsingError
 from .scraper import Scraper
@@ -42,13 +42,16 @@ class RaceClimbs(Scraper):
     }
 
     """
-    def _html_valid(self) -> bool:
+    def _html_valid(self,
+                    raw_html: Optional[Union[str, bytes]] = None) -> bool:
         """
         Extends Scraper method for validating HTMLs.
 
+        :param raw_html: HTML that `self.html` was created from.
         :return: True if given HTML is valid, otherwise False
         """
-        return self.html.css_first("div.page-content > h2").text() == "Climbs"
+        title_html = self.html.css_first("div.page-content > h2")
+        return title_html is not None and title_html.text() == "Climbs"
 
     def climbs(self, *args: str) -> List[Dict[str, Any]]:
         """
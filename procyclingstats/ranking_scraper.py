@@ -1,4 +1,3 @@
-import re
 from typing import Any, Dict, List, Literal, Tuple
 
 from .errors import ExpectedParsingError
@@ -492,8 +491,7 @@ class Ranking(Scraper):
         if len(relative_url.split("/")) < 3 and "?" not in relative_url:
             return "individual"
         if "races" in relative_url:
-            l = [m.start() for m in re.finditer("races", relative_url)]
-            if relative_url[l[0] - 1] != "-":
+            if relative_url[relative_url.find("races") - 1] != "-":
                 return "races"
         if "distance" in relative_url:
             return "distance"
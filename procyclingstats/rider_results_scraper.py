@@ -1,4 +1,4 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Union
 
 from .errors import ExpectedParsingError
 from .scraper import Scraper
@@ -52,14 +52,16 @@ class RiderResults(Scraper):
         ...
     }
     """
-    def _html_valid(self) -> bool:
+    def _html_valid(self,
+                    raw_html: Optional[Union[str, bytes]] = None) -> bool:
         """
         Extends Scraper method for validating HTMLs.
 
+        :param raw_html: HTML that `self.html` was created from.
         :return: True if given HTML is valid, otherwise False
         """
         try:
-            assert super()._html_valid()
+            assert super()._html_valid(raw_html)
             page_title = self.html.css_first(".page-content > h2").text()
             assert page_title in ("All results",
                 "Top results final 5k analysis")
@@ -1,9 +1,27 @@
-import calendar
-from typing import Any, Dict, List
+import re
+from functools import cached_property
+from typing import Any, Dict, List, Optional
+
+from selectolax.parser import Node
 
 from .scraper import Scraper
 from .table_parser import TableParser
-from .utils import get_day_month, parse_table_fields_args
+from .utils import MONTH_INDEX, get_since_until, parse_table_fields_args
+
+_TEAM_CLASS_CLEAN = re.compile(r"[() ]")
+"""Regex matching characters around team's class, e.g. in ``(WT)``."""
+
+
+def _parse_team_class(text: str) -> Optional[str]:
+    """
+    Parses team's class from teams history column.
+
+    :param text: Column text, e.g. `` (WT)``.
+    :return: Team's class, None when the row isn't a team (rider retired).
+    """
+    if not text or "retired" in text.lower():
+        return None
+    return _TEAM_CLASS_CLEAN.sub("", text)
 
 
 class Rider(Scraper):
@@ -15,28 +33,55 @@ class Rider(Scraper):
     >>> from procyclingstats import Rider
     >>> rider = Rider("rider/tadej-pogacar")
     >>> rider.birthdate()
-    '1998-9-21'
+    '1998-09-21'
     >>> rider.parse()
     {
-        'birthdate': '1998-9-21',
+        'birthdate': '1998-09-21',
         'height': 1.76,
         'name': 'Tadej  Pogačar',
         'nationality': 'SI',
         ...
     }
     """
+    @cached_property
+    def _info_cont(self) -> Node:
+        """General info container, shared by most of the parsing methods."""
+        return self.html.css_first(".rdr-info-cont")
+
+    @cached_property
+    def _page_title(self) -> Node:
+        """Page title containing rider's name."""
+        return self.html.css_first(".page-title > .main > h1")
+
+    @cached_property
+    def _teams_list(self) -> Node:
+        """List with rider's teams history."""
+        return self.html.css_first("ul.list.rdr-teams")
+
+    @cached_property
+    def _seasons_table(self) -> Node:
+        """Table with rider's points per season."""
+        return self.html.css_first("table.rdr-season-stats")
+
+    @cached_property
+    def _info_prefix(self) -> str:
+        """
+        Selector of the element containing rider's general info. In special
+        layout (e.g. rider passed away) the info is wrapped in another span.
+        """
+        if self._info_cont.css_first(".rdr-info-cont > .flag") is None:
+            return ".rdr-info-cont > span"
+        return ".rdr-info-cont"
+
     def birthdate(self) -> str:
         """
         Parses rider's birthdate from HTML.
 
         :return: birthday of the rider in ``YYYY-MM-DD`` format.
         """
-        general_info_html = self.html.css_first(".rdr-info-cont")
-        bd_string = general_info_html.text(separator=" ", deep=False)
-        bd_list = [item for item in bd_string.split(" ") if item][:3]
-        [day, str_month, year] = bd_list
-        month = list(calendar.month_name).index(str_month)
-        return f"{year}-{month}-{day}"
+        bd_string = self._info_cont.text(separator=" ", deep=False)
+        [day, str_month, year] = bd_string.split(maxsplit=3)[:3]
+        return f"{year}-{MONTH_INDEX[str_month]:02d}-{int(day):02d}"
 
     def place_of_birth(self) -> str:
         """
@@ -44,16 +89,9 @@ class Rider(Scraper):
 
         :return: rider's place of birth (town only).
         """
-        # normal layout
-        try:
-            place_of_birth_html = self.html.css_first(
-                ".rdr-info-cont > span > span > a")
-            return place_of_birth_html.text()
-        # special layout
-        except AttributeError:
-            place_of_birth_html = self.html.css_first(
-                ".rdr-info-cont > span > span > span > a")
-            return place_of_birth_html.text()
+        place_of_birth_html = self._info_cont.css_first(
+            f"{self._info_prefix} > span > span > a")
+        return place_of_birth_html.text()
 
     def name(self) -> str:
         """
@@ -61,7 +99,7 @@ class Rider(Scraper):
 
         :return: Rider's name.
         """
-        return self.html.css_first(".page-title > .main > h1").text()
+        return self._page_title.text()
 
     def weight(self) -> float:
         """
@@ -69,14 +107,8 @@ class Rider(Scraper):
 
         :return: Rider's weigth in kilograms.
         """
-        # normal layout
-        try:
-            weight_html = self.html.css(".rdr-info-cont > span")[1]
-            return float(weight_html.text().split(" ")[1])
-        # special layout
-        except (AttributeError, IndexError):
-            weight_html = self.html.css(".rdr-info-cont > span > span")[1]
-            return float(weight_html.text().split(" ")[1])
+        weight_html = self._info_cont.css(f"{self._info_prefix} > span")[1]
+        return float(weight_html.text().split(" ")[1])
 
     def height(self) -> float:
         """
@@ -84,15 +116,9 @@ class Rider(Scraper):
 
         :return: Rider's height in meters.
         """
-        # normal layout
-        try:
-            height_html = self.html.css_first(".rdr-info-cont > span > span")
-            return float(height_html.text().split(" ")[1])
-        # special layout
-        except (AttributeError, IndexError):
-            height_html = self.html.css_first(
-                ".rdr-info-cont > span > span > span")
-            return float(height_html.text().split(" ")[1])
+        height_html = self._info_cont.css_first(
+            f"{self._info_prefix} > span > span")
+        return float(height_html.text().split(" ")[1])
 
     def nationality(self) -> str:
         """
@@ -101,12 +127,8 @@ class Rider(Scraper):
         :return: Rider's current nationality as 2 chars long country code in
             uppercase.
         """
-        # normal layout
-        nationality_html = self.html.css_first(".rdr-info-cont > .flag")
-        if nationality_html is None:
-        # special layout
-            nationality_html = self.html.css_first(
-                ".rdr-info-cont > span > span")
+        nationality_html = self._info_cont.css_first(
+            f"{self._info_prefix} > .flag")
         flag_class = nationality_html.attributes['class']
         return flag_class.split(" ")[-1].upper() # type:ignore
 
@@ -139,25 +161,22 @@ class Rider(Scraper):
             "class"
         )
         fields = parse_table_fields_args(args, available_fields)
-        seasons_html_table = self.html.css_first("ul.list.rdr-teams")
+        seasons_html_table = self._teams_list
         table_parser = TableParser(seasons_html_table)
         casual_fields = [f for f in fields
                          if f in ("season", "team_name", "team_url")]
         if casual_fields:
             table_parser.parse(casual_fields)
         # add classes for row validity checking
-        classes = table_parser.parse_extra_column(2,
-            lambda x: x.replace("(", "").replace(")", "").replace(" ", "")
-            if x and "retired" not in x.lower() else None)
+        classes = table_parser.parse_extra_column(2, _parse_team_class)
         table_parser.extend_table("class", classes)
+        if "since" in fields or "until" in fields:
+            # column with since and until dates is parsed only once
+            dates = table_parser.parse_extra_column(-2, get_since_until)
         if "since" in fields:
-            until_dates = table_parser.parse_extra_column(-2,
-                lambda x: get_day_month(x) if "as from" in x else "01-01")
-            table_parser.extend_table("since", until_dates)
+            table_parser.extend_table("since", [since for since, _ in dates])
         if "until" in fields:
-            until_dates = table_parser.parse_extra_column(-2,
-                lambda x: get_day_month(x) if "until" in x else "12-31")
-            table_parser.extend_table("until", until_dates)
+            table_parser.extend_table("until", [until for _, until in dates])
 
         table = [row for row in table_parser.table if row['class']]
         # remove class field if isn't needed
@@ -186,7 +205,7 @@ class Rider(Scraper):
             "rank"
         )
         fields = parse_table_fields_args(args, available_fields)
-        points_table_html = self.html.css_first("table.rdr-season-stats")
+        points_table_html = self._seasons_table
         table_parser = TableParser(points_table_html)
         table_parser.parse(fields)
         return table_parser.table
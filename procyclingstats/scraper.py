@@ -1,11 +1,85 @@
-import inspect
-from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+import datetime
+import threading
+import types
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
+from importlib.metadata import PackageNotFoundError, version
+from typing import (Any, Callable, ClassVar, Dict, List, Optional, Tuple, Type,
+                    TypeVar, Union)
 
 import requests
+from requests.adapters import HTTPAdapter
 from selectolax.parser import HTMLParser
+from urllib3.util import Retry, make_headers
 
 from .errors import ExpectedParsingError
 
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+try:
+    USER_AGENT = f"procyclingstats/{version('procyclingstats')}"
+except PackageNotFoundError:
+    # package isn't installed (e.g. running from source)
+    USER_AGENT = "procyclingstats"
+
+_PAGE_NOT_FOUND_MESSAGE = "Page not found"
+_UNAVAILABLE_PAGE_MESSAGE = ("Due to technical difficulties this page is " +
+    "temporarily unavailable.")
+_ERROR_MESSAGES = (_PAGE_NOT_FOUND_MESSAGE, _UNAVAILABLE_PAGE_MESSAGE)
+"""Messages contained in invalid HTMLs."""
+_ERROR_MESSAGES_BYTES = tuple(message.encode() for message in _ERROR_MESSAGES)
+"""Messages contained in invalid HTMLs, encoded for searching raw HTML."""
+
+ScraperT = TypeVar("ScraperT", bound="Scraper")
+
+POOL_SIZE = 32
+"""Maximum number of connections kept open by the shared session."""
+
+
+def _create_session(
+        cache_options: Optional[Dict[str, Any]] = None) -> requests.Session:
+    """
+    Creates session with pooled connections, persistent headers and retries
+    on failed requests.
+
+    :param cache_options: Keyword arguments for `requests_cache.CachedSession`,
+        defaults to None. When None, responses aren't cached.
+    :return: Session ready for making requests to PCS.
+    """
+    if cache_options is not None:
+        session = requests_cache.CachedSession(**cache_options)
+    else:
+        session = requests.Session()
+    # accept brotli encoding only when it can be decoded (brotli installed)
+    session.headers.update(make_headers(keep_alive=True, accept_encoding=True,
+        user_agent=USER_AGENT))
+    adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE,
+        max_retries=Retry(total=3, backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            respect_retry_after_header=True, raise_on_status=False))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+@lru_cache(maxsize=4096)
+def _make_url_absolute(url: str, base_url: str) -> str:
+    """
+    Makes absolute URL from given URL (adds `base_url` to URL if needed).
+
+    :param url: URL to format.
+    :param base_url: URL to add before relative URL.
+    :return: Absolute URL.
+    """
+    if url.startswith(("http://", "https://")):
+        return url
+    if url.startswith("/"):
+        return base_url + url[1:]
+    return base_url + url
+
 
 class Scraper:
     """Base class for all scraping classes."""
@@ -14,11 +88,37 @@ class Scraper:
     _public_nonparsing_methods = (
         "update_html",
         "parse",
-        "relative_url"
+        "relative_url",
+        "build_many",
+        "enable_cache"
     )
     """Public methods that aren't called by `parse` method."""
 
-    def __init__(self, url: str, html: Optional[str] = None,
+    _parser_kwargs: ClassVar[Dict[str, Any]] = {
+        "detect_encoding": False,
+        "use_meta_tags": False
+    }
+    """
+    Keyword arguments for HTMLParser. PCS pages are always UTF-8 encoded, so
+    encoding detection is skipped.
+    """
+
+    _parsing_methods_names: ClassVar[Tuple[str, ...]] = ()
+    """Names of parsing methods, set when subclass is created."""
+
+    _session: ClassVar[Optional[requests.Session]] = None
+    """
+    Session shared by all scrapers, so connections to PCS are reused. Created
+    when the first request is made.
+    """
+
+    _session_lock: ClassVar[threading.Lock] = threading.Lock()
+    """Lock for creating the shared session from multiple threads."""
+
+    _cache_options: ClassVar[Optional[Dict[str, Any]]] = None
+    """Options of responses cache, None when caching isn't enabled."""
+
+    def __init__(self, url: str, html: Optional[Union[str, bytes]] = None,
                  update_html: bool = True) -> None:
         """
         Creates scraper object that is by default ready for HTML parsing. Call
@@ -27,8 +127,8 @@ class Scraper:
         :param url: URL of procyclingstats page to parse. Either absolute or
             relative.
         :param html: HTML to be parsed from, defaults to None. When passing the
-            parameter, set `update_html` to False to prevent overriding or
-            making useless request.
+            parameter, set `update_html` to False, otherwise the HTML is
+            ignored and request is made.
         :param update_html: Whether to make request to given URL and update
             `self.html`. When False `self.update_html` method has to be called
             manually to make object ready for parsing. Defaults to True.
@@ -39,17 +139,96 @@ class Scraper:
         # validate given URL
         self._url = self._make_url_absolute(url)
         self._html = None
-        if html:
-            self._html = HTMLParser(html)
-            if not self._html_valid():
-                raise ValueError("Given HTML is invalid.")
-            self._set_up_html()
+        # given HTML would be overridden by the requested one, so it's parsed
+        # only when request isn't made
         if update_html:
-            self.update_html()
-            if not self._html_valid():
+            html = self._request_html()
+        elif not html:
+            return
+        self._html = HTMLParser(html, **self._parser_kwargs)
+        if not self._html_valid(html):
+            if update_html:
                 raise ValueError(
                     f"HTML from given URL is invalid: '{self.url}'")
-            self._set_up_html()
+            raise ValueError("Given HTML is invalid.")
+        self._set_up_html()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """
+        Finds names of all parsing methods of the subclass. That are all public
+        methods except of methods listed in `_public_nonparsing_methods`.
+        """
+        super().__init_subclass__(**kwargs)
+        names = set()
+        for klass in cls.__mro__:
+            for attr_name, attr in vars(klass).items():
+                if (attr_name[0] != "_"
+                    and attr_name not in cls._public_nonparsing_methods
+                    and isinstance(attr, (types.FunctionType, classmethod))):
+                    names.add(attr_name)
+        cls._parsing_methods_names = tuple(sorted(names))
+
+    @classmethod
+    def build_many(cls: Type[ScraperT], urls: List[str],
+                   concurrency: int = 16) -> List[ScraperT]:
+        """
+        Creates scraper objects ready for parsing from all given URLs. Requests
+        to the URLs are made concurrently.
+
+        :param urls: URLs of procyclingstats pages to parse. Either absolute
+            or relative.
+        :param concurrency: Maximum number of requests made at the same time,
+            defaults to 16. Values above `POOL_SIZE` are lowered to it, so
+            all connections can be reused.
+
+        :raises ValueError: When HTML from one of given URLs is invalid.
+            Requests that haven't started yet are cancelled in that case.
+        :return: List of scraper objects in the same order as given URLs.
+        """
+        concurrency = min(concurrency, POOL_SIZE)
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            try:
+                return list(executor.map(cls, urls))
+            except BaseException:
+                executor.shutdown(cancel_futures=True)
+                raise
+
+    @staticmethod
+    def enable_cache(path: str = ".pcs_cache",
+            expire_after: Union[int, datetime.timedelta] =
+                datetime.timedelta(hours=1)) -> None:
+        """
+        Enables caching of responses for all scrapers in SQLite database.
+        Requires optional `requests-cache` package. Until a cached response
+        expires, it's read from the disk without making any request.
+        Cache-Control headers returned by PCS are respected and expired
+        responses are revalidated using ETag and Last-Modified headers when
+        PCS sends them.
+
+        :param path: Path to the cache database, `.sqlite` is appended to it.
+            Defaults to ``".pcs_cache"``.
+        :param expire_after: Time after which cached response expires, when
+            PCS doesn't specify it. Either timedelta or number of seconds,
+            defaults to 1 hour. Use 0 to revalidate on every request or lower
+            it when scraping live results.
+
+        :raises ImportError: When `requests-cache` package isn't installed.
+        """
+        if requests_cache is None:
+            raise ImportError("Package `requests-cache` is needed for " +
+                "caching, install it with " +
+                "`pip install procyclingstats[cache]`")
+        with Scraper._session_lock:
+            Scraper._cache_options = {
+                "cache_name": path,
+                "backend": "sqlite",
+                "expire_after": expire_after,
+                "cache_control": True
+            }
+            # new session is created with cache by the next request
+            if Scraper._session is not None:
+                Scraper._session.close()
+            Scraper._session = None
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}(url='{self.url}')"
@@ -85,9 +264,8 @@ class Scraper:
         Calls request to `self.url` and updates `self.html` to HTMLParser
         object created from returned HTML.
         """
-        html_str = requests.get(self._url).text \
-            # pylint: disable=missing-timeout
-        self._html = HTMLParser(html_str)
+        self._html = HTMLParser(self._request_html(), **self._parser_kwargs)
+        self._clear_cached_properties()
 
     def parse(self,
             exceptions_to_ignore: Tuple[
@@ -131,13 +309,39 @@ class Scraper:
 
         :return: List of tuples parsing methods names and parsing methods.
         """
-        methods = inspect.getmembers(self, predicate=inspect.ismethod)
-        parsing_methods = []
-        for method_name, method in methods:
-            if (method_name[0] != "_"
-                and method_name not in self._public_nonparsing_methods):
-                parsing_methods.append((method_name, method))
-        return parsing_methods
+        return [(method_name, getattr(self, method_name))
+                for method_name in self._parsing_methods_names]
+
+    def _request_html(self) -> bytes:
+        """
+        Makes request to `self.url` using the shared session.
+
+        :return: Undecoded HTML returned by the request (PCS pages are UTF-8
+            encoded, so HTMLParser doesn't have to get decoded string).
+        """
+        return self._get_session().get(self._url, timeout=10).content
+
+    @staticmethod
+    def _get_session() -> requests.Session:
+        """
+        Gets session shared by all scrapers, creates it if it doesn't exist.
+
+        :return: Shared session.
+        """
+        with Scraper._session_lock:
+            if Scraper._session is None:
+                Scraper._session = _create_session(Scraper._cache_options)
+            return Scraper._session
+
+    def _clear_cached_properties(self) -> None:
+        """
+        Removes values of all cached properties (e.g. cached HTML nodes), so
+        they are computed again from the current HTML.
+        """
+        for cls in type(self).__mro__:
+            for attr_name, attr in vars(cls).items():
+                if isinstance(attr, cached_property):
+                    self.__dict__.pop(attr_name, None)
 
     def _make_url_absolute(self, url: str) -> str:
         """
@@ -147,12 +351,7 @@ class Scraper:
         :param url: URL to format.
         :return: Absolute URL.
         """
-        if "https" not in url:
-            if url[0] == "/":
-                url = self.BASE_URL + url[1:]
-            else:
-                url = self.BASE_URL + url
-        return url
+        return _make_url_absolute(url, self.BASE_URL)
 
     def _set_up_html(self):
         """
@@ -160,24 +359,35 @@ class Scraper:
         modify HTML before parsing.
         """
 
-    def _html_valid(self) -> bool:
+    def _html_valid(self,
+                    raw_html: Optional[Union[str, bytes]] = None) -> bool:
         """
         Checks whether given HTML is valid based on some known invalid formats
         of invalid HTMLs.
 
+        :param raw_html: HTML that `self.html` was created from. When given,
+            error messages are searched in it first and HTML elements are
+            checked only if one of them is found.
         :return: True if given HTML is valid, otherwise False.
         """
+        page_title_html = self.html.css_first(".page-title > .main > h1")
+        # e.g. empty response
+        if page_title_html is None:
+            return False
         try:
-            page_title = self.html.css_first(".page-title > .main > h1").text()
-            assert page_title != "Page not found"
+            page_title = page_title_html.text()
+            assert page_title != "Start"
+            if raw_html is not None:
+                messages = _ERROR_MESSAGES
+                if isinstance(raw_html, bytes):
+                    messages = _ERROR_MESSAGES_BYTES
+                if not any(message in raw_html for message in messages):
+                    return True
 
-            page_title2 = self.html.css_first("div.page-content > div").text()
-            assert page_title2 != ("Due to technical difficulties this page " +
-            "is temporarily unavailable.")
+            assert page_title != _PAGE_NOT_FOUND_MESSAGE
 
-            page_title3 = self.html.css_first(
-                ".page-title > .main > h1").text()
-            assert page_title3 != "Start"
+            page_title2 = self.html.css_first("div.page-content > div").text()
+            assert page_title2 != _UNAVAILABLE_PAGE_MESSAGE
             return True
         except AssertionError:
             return False
@@ -648,9 +648,11 @@ class Stage(Scraper):
 
         # create two copies of HTML table (one for riders and one for teams),
         # so we won't modify self.html
-        riders_elements = HTMLParser(results_table_html.html) # type: ignore
+        riders_elements = HTMLParser(results_table_html.html, # type: ignore
+            **Scraper._parser_kwargs)
         riders_table = riders_elements.css_first("table")
-        teams_elements = HTMLParser(results_table_html.html) # type: ignore
+        teams_elements = HTMLParser(results_table_html.html, # type: ignore
+            **Scraper._parser_kwargs)
         teams_table = teams_elements.css_first("table")
         # remove unwanted rows from both tables
         riders_table.unwrap_tags(["tr.team"])
@@ -2,7 +2,7 @@ from typing import Any, Dict, List, Optional
 
 from .scraper import Scraper
 from .table_parser import TableParser
-from .utils import (get_day_month, join_tables, parse_select,
+from .utils import (get_since_until, join_tables, parse_select,
                     parse_table_fields_args)
 
 
@@ -229,14 +229,12 @@ class Team(Scraper):
             since_until_html_table = all_tables[mapping["name"]]
             since_tp = TableParser(since_until_html_table)
             since_tp.parse(["rider_url"])
+            # column with since and until dates is parsed only once
+            dates = since_tp.parse_extra_column(2, get_since_until)
             if "since" in fields:
-                since_dates = since_tp.parse_extra_column(2,
-                    lambda x: get_day_month(x) if "as from" in x else "01-01")
-                since_tp.extend_table("since", since_dates)
+                since_tp.extend_table("since", [since for since, _ in dates])
             if "until" in fields:
-                until_dates = since_tp.parse_extra_column(2,
-                    lambda x: get_day_month(x) if "until" in x else "12-31")
-                since_tp.extend_table("until", until_dates)
+                since_tp.extend_table("until", [until for _, until in dates])
             table = join_tables(table, since_tp.table, "rider_url")
 
         # remove rider_url field if wasn't requested and was used for joining
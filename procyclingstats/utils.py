@@ -1,5 +1,4 @@
-import datetime
-import math
+import calendar
 import re
 from typing import Any, Dict, List, Tuple, Union
 
@@ -7,6 +6,12 @@ from selectolax.parser import HTMLParser, Node
 
 from .errors import ExpectedParsingError
 
+MONTH_INDEX = {name: i for i, name in enumerate(calendar.month_name) if name}
+"""Maps month names (e.g. `July`) to month numbers."""
+
+SINCE_UNTIL_REGEX = re.compile(r"(as from|until)\s+(\d{1,2})[/-](\d{1,2})")
+"""Matches first or last day in a team, e.g. `as from 01/09`."""
+
 
 # date and time manipulation functions
 def get_day_month(str_with_date: str) -> str:
@@ -35,6 +40,24 @@ def get_day_month(str_with_date: str) -> str:
     raise ValueError(
         "Given string doesn't contain day and month in wanted format")
 
+def get_since_until(str_with_dates: str) -> Tuple[str, str]:
+    """
+    Gets first and last day in a team from string containing `as from` and
+    `until` dates, e.g. `as from 01/03 until 30/06`.
+
+    :param str_with_dates: String with dates in day/month or day-month format.
+    :return: Tuple of since and until dates in `MM-DD` format, `01-01` and
+    `12-31` when the date isn't in the string.
+    """
+    since, until = "01-01", "12-31"
+    for match in SINCE_UNTIL_REGEX.finditer(str_with_dates):
+        date = f"{int(match[3]):02d}-{int(match[2]):02d}"
+        if match[1] == "as from":
+            since = date
+        else:
+            until = date
+    return since, until
+
 def convert_date(date: str) -> str:
     """
     Converts given date to `YYYY-MM-DD` format.
@@ -44,37 +67,7 @@ def convert_date(date: str) -> str:
     :return: Date in `YYYY-MM-DD` format.
     """
     [day, month, year] = date.split(" ")
-    month = datetime.datetime.strptime(month, "%B").month
-    month = f"0{month}" if month < 10 else str(month)
-    return "-".join([year, month, day])
-
-def timedelta_to_time(tdelta: datetime.timedelta) -> str:
-    """
-    Converts timedelta object to time in `H:MM:SS` format.
-
-    :param tdelta: Timedelta to convert.
-    :return: Formatted time.
-    """
-    time = str(tdelta).split(" ")
-    if len(time) > 1:
-        days = time[0]
-        time = time[2]
-        hours = int(time.split(":")[0]) + (24 * int(days))
-        minutes_seconds = ":".join(time.split(":")[1:])
-    else:
-        hours = time[0].split(":")[0]
-        minutes_seconds = ":".join(time[0].split(":")[1:])
-    return f"{hours}:{minutes_seconds}"
-
-def time_to_timedelta(time: str) -> datetime.timedelta:
-    """
-    Converts time in `H:MM:SS` format to timedelta object.
-
-    :param time: Time to convert.
-    :return: Timedelta object.
-    """
-    [hours, minutes, seconds] = [int(value) for value in time.split(":")]
-    return datetime.timedelta(hours=hours, minutes=minutes, seconds=seconds)
+    return f"{year}-{MONTH_INDEX[month]:02d}-{day}"
 
 def format_time(time: str) -> str:
     """
@@ -83,16 +76,13 @@ def format_time(time: str) -> str:
     :param time: Time to convert.
     :return: Formatted time e.g. `31:03:11`.
     """
-    splitted_time = time.split(":")
-    # make minutes and seconds two digits long
-    for i, time_val in enumerate(splitted_time [-2:]):
-        if len(time_val) == 1:
-            splitted_time[i] = "0" + time_val
-    time_str = ":".join(splitted_time)
-    # add hours if needed
-    if len(splitted_time) == 2:
-        time_str = "0:" + time_str
-    return time_str
+    if ":" not in time:
+        # only seconds are given (e.g. bonus), make them two digits long
+        return "0" + time if len(time) == 1 else time
+    hours_minutes, seconds = time.rsplit(":", 1)
+    hours, _, minutes = hours_minutes.rpartition(":")
+    # add hours if needed and make minutes and seconds two digits long
+    return f"{hours or 0}:{minutes:0>2}:{seconds:0>2}"
 
 def add_times(time1: str, time2: str) -> str:
     """
@@ -103,10 +93,13 @@ def add_times(time1: str, time2: str) -> str:
     :param time2: Time separated with colons.
     :return: Time in `H:MM:SS` format.
     """
-    tdelta1 = time_to_timedelta(format_time(time1))
-    tdelta2 = time_to_timedelta(format_time(time2))
-    tdelta = tdelta1 + tdelta2
-    return timedelta_to_time(tdelta)
+    seconds = 0
+    for time in (time1, time2):
+        [hours, minutes, secs] = map(int, format_time(time).split(":"))
+        seconds += hours * 3600 + minutes * 60 + secs
+    hours, seconds = divmod(seconds, 3600)
+    minutes, seconds = divmod(seconds, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}"
 
 # HTML parsing functions
 def parse_select(select_menu: Node) -> List[Dict[str, str]]:
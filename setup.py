@@ -20,4 +20,7 @@ setup(
         "requests",
         "selectolax"
     ],
+    extras_require={
+        "cache": ["requests-cache"]
+    },
 )
@@ -0,0 +1,88 @@
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from procyclingstats import Rider, Scraper, scraper
+
+from .fixtures_utils import FixturesUtils
+
+
+def test_build_many(monkeypatch) -> None:
+    """
+    Tests that `Scraper.build_many` keeps order of given URLs and raises
+    ValueError when one of the pages is invalid.
+    """
+    f_utils = FixturesUtils(fixtures_path="tests/fixtures/")
+    invalid_html = ('<div class="page-title"><div class="main">' +
+        '<h1>Page not found</h1></div></div>')
+
+    requested_urls = []
+
+    def request_html(rider: Rider) -> str:
+        requested_urls.append(rider.relative_url())
+        html = f_utils.get_html_fixture(rider.relative_url())
+        return html if html is not None else invalid_html
+
+    monkeypatch.setattr(Rider, "_request_html", request_html)
+    urls = ["rider/david-canada", "rider/alberto-contador"]
+    riders = Rider.build_many(urls, concurrency=2)
+    assert [rider.relative_url() for rider in riders] == urls
+    assert [rider.name() for rider in riders] == [
+        "David  Cañada", "Alberto  Contador"]
+
+    with pytest.raises(ValueError):
+        Rider.build_many(urls + ["rider/not-existing-rider"])
+
+    # requests that haven't started are cancelled after the invalid page
+    requested_urls.clear()
+    with pytest.raises(ValueError):
+        Rider.build_many(["rider/not-existing-rider"] + urls * 20,
+                         concurrency=1)
+    assert len(requested_urls) < 41
+
+
+def test_make_url_absolute() -> None:
+    """Tests that only relative URLs get `Scraper.BASE_URL` prepended."""
+    absolute_url = f"{Scraper.BASE_URL}rider/tadej-pogacar"
+    for url in ("rider/tadej-pogacar", "/rider/tadej-pogacar", absolute_url):
+        assert Scraper(url, update_html=False).url == absolute_url
+    http_url = "http://www.procyclingstats.com/rider/tadej-pogacar"
+    assert Scraper(http_url, update_html=False).url == http_url
+
+
+def test_enable_cache(monkeypatch) -> None:
+    """
+    Tests that `Scraper.enable_cache` closes the current session and that the
+    next request creates cached session.
+    """
+    class CachedSession(requests.Session):
+        def __init__(self, **kwargs: Any) -> None:
+            super().__init__()
+            self.cache_options = kwargs
+
+    old_session = Scraper._get_session()
+    old_session_close = Mock(wraps=old_session.close)
+    monkeypatch.setattr(old_session, "close", old_session_close)
+    monkeypatch.setattr(Scraper, "_session", old_session)
+    monkeypatch.setattr(Scraper, "_cache_options", None)
+    monkeypatch.setattr(scraper, "requests_cache",
+        SimpleNamespace(CachedSession=CachedSession))
+
+    Scraper.enable_cache("tests/cache", expire_after=60)
+    old_session_close.assert_called_once()
+    session = Scraper._get_session()
+    assert isinstance(session, CachedSession)
+    assert session.cache_options == {
+        "cache_name": "tests/cache",
+        "backend": "sqlite",
+        "expire_after": 60,
+        "cache_control": True
+    }
+    assert Scraper._get_session() is session
+
+    monkeypatch.setattr(scraper, "requests_cache", None)
+    with pytest.raises(ImportError):
+        Scraper.enable_cache()
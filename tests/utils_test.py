@@ -0,0 +1,17 @@
+from procyclingstats.utils import format_time, get_since_until
+
+
+def test_format_time() -> None:
+    """Tests formatting of times with seconds, minutes and hours."""
+    assert format_time("5") == "05"
+    assert format_time("1:5") == "0:01:05"
+    assert format_time("12:34") == "0:12:34"
+    assert format_time("10:5:3") == "10:05:03"
+
+
+def test_get_since_until() -> None:
+    """Tests parsing of first and last day in a team."""
+    assert get_since_until("\xa0trainee as from 01/09") == ("09-01", "12-31")
+    assert get_since_until(" until 10/09") == ("01-01", "09-10")
+    assert get_since_until("as from  1/3 until 30-06") == ("03-01", "06-30")
+    assert get_since_until("") == ("01-01", "12-31")